@@ -0,0 +1,111 @@
+"""
+Command line interface for scraping reddit, sampling the coronavirus dataset and exporting
+ngram data.
+
+Examples:
+    python cli.py scrape --subreddit coronavirus --number-of-results 2000 --min-score 2
+    python cli.py sample --dataset coronavirus --select-by score --output sample.csv
+    python cli.py ngrams covid "wuhan virus" "china virus" --output corona_names.csv
+
+The modules that do the actual work are only imported once we know which command is run,
+so that e.g. `python cli.py --help` starts up quickly.
+"""
+
+import argparse
+import csv
+
+
+def scrape(args):
+    from reddit_scraper import RedditScraper
+
+    r = RedditScraper(
+        search_term=args.search_term, subreddit=args.subreddit,
+        number_of_results=args.number_of_results,
+        start_date=args.start_date, end_date=args.end_date,
+        min_score=args.min_score, sort_by=args.sort_by
+    )
+    r.execute_query_and_store_as_csv(output_filename=args.output_filename)
+
+
+def sample(args):
+    from corona_dataset import CoronaDataset
+
+    dataset = CoronaDataset(dataset_name=args.dataset)
+    comments = dataset.get_data_sample(
+        start_date=args.start_date, end_date=args.end_date,
+        number_of_comments=args.number_of_comments,
+        minimum_number_of_words_per_comment=args.minimum_number_of_words_per_comment,
+        select_by=args.select_by,
+        must_include_terms=args.must_include_terms,
+        must_exclude_terms=args.must_exclude_terms
+    )
+
+    with open(args.output, 'w', encoding='utf-8') as csvfile:
+        fieldnames = ['date', 'author', 'subreddit', 'score', 'url', 'text']
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        for comment in comments:
+            writer.writerow(comment)
+    print(f'Stored {len(comments)} comments in {args.output}.')
+
+
+def ngrams(args):
+    from ngram_plot import store_ngram_data_in_csv
+
+    store_ngram_data_in_csv(args.terms, args.output)
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        description='Scrape reddit, sample the coronavirus dataset and export ngram data.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    scrape_parser = subparsers.add_parser(
+        'scrape', help='download comments from pushshift.io and store them in data/')
+    scrape_parser.add_argument('--search-term')
+    scrape_parser.add_argument('--subreddit')
+    scrape_parser.add_argument('--number-of-results', type=int, default=100)
+    scrape_parser.add_argument('--start-date', default='1990-01-01', help='YYYY-MM-DD')
+    scrape_parser.add_argument('--end-date', default='2030-01-01', help='YYYY-MM-DD')
+    scrape_parser.add_argument('--min-score', type=int, default=0)
+    scrape_parser.add_argument('--sort-by', default='score')
+    scrape_parser.add_argument('--output-filename',
+                               help='name of the csv in data/ (without .csv)')
+    scrape_parser.set_defaults(func=scrape)
+
+    sample_parser = subparsers.add_parser(
+        'sample', help='store a sample of the coronavirus dataset as a csv')
+    sample_parser.add_argument('--dataset', default='all_subreddits',
+                               choices=['all_subreddits', 'china_flu', 'coronavirus'])
+    sample_parser.add_argument('--start-date', default='2020-01-01', help='YYYY-MM-DD')
+    sample_parser.add_argument('--end-date', default='2020-04-04', help='YYYY-MM-DD')
+    sample_parser.add_argument('--number-of-comments', type=int, default=1000)
+    sample_parser.add_argument('--minimum-number-of-words-per-comment', type=int, default=10)
+    sample_parser.add_argument('--select-by', default='random', choices=['random', 'score'])
+    sample_parser.add_argument('--must-include-terms', nargs='+')
+    sample_parser.add_argument('--must-exclude-terms', nargs='+')
+    sample_parser.add_argument('--output', required=True, help='csv file to write')
+    sample_parser.set_defaults(func=sample)
+
+    ngrams_parser = subparsers.add_parser(
+        'ngrams', help='store daily (moving averaged) counts of terms as a csv')
+    ngrams_parser.add_argument('terms', nargs='+')
+    ngrams_parser.add_argument('--output', required=True, help='csv file to write')
+    ngrams_parser.set_defaults(func=ngrams)
+
+    return parser
+
+
+def main(argv=None):
+    parser = get_parser()
+    args = parser.parse_args(argv)
+
+    # check arguments before any work is done, so mistakes show the usage instead of a traceback
+    if args.command in {'sample', 'ngrams'} and not args.output.endswith('.csv'):
+        parser.error("data will be written in csv format, so --output has to end in '.csv'.")
+
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
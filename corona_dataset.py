@@ -1,9 +1,7 @@
 from pathlib import Path
 
-from IPython import embed
 import csv
 import re
-import urllib.request
 
 import random
 # set random seed so that we can randomly select documents but will always
@@ -60,6 +58,9 @@ class CoronaDataset:
 
         # if file not locally available, download it
         if not file_path.exists():
+            # urllib.request is only imported when we actually need to download the dataset
+            # because it is comparatively slow to import
+            import urllib.request
             url = f'https://corona-datasets.s3-us-west-2.amazonaws.com/{self.dataset_name}.csv'
             file_content = urllib.request.urlopen(url).read().decode('utf-8')
             with open(file_path, 'w') as outfile:
@@ -182,6 +183,7 @@ class CoronaDataset:
 
 
 if __name__ == '__main__':
+    from IPython import embed
 
     c = CoronaDataset(dataset_name='china_flu')
     c = CoronaDataset(dataset_name='all_subreddits')
@@ -0,0 +1,261 @@
+from pathlib import Path
+
+import csv
+import heapq
+import tempfile
+
+FIELDNAMES = ['date', 'author', 'subreddit', 'score', 'url', 'text']
+
+
+def get_comment_id(document):
+    """
+    Returns the reddit id of a comment, which is the last part of its permalink url.
+    Comments without a permalink ('n/a') have no id and None is returned.
+
+    :param document: dict
+    :return: str or None
+
+    >>> get_comment_id({'url': 'https://www.reddit.com/r/Coronavirus/comments/fug3vz/us_blocks/fmclle7/'})
+    'fmclle7'
+    >>> get_comment_id({'url': 'n/a'}) is None
+    True
+    """
+
+    url = document['url']
+    if url == 'n/a' or not url:
+        return None
+    return url.rstrip('/').rsplit('/', 1)[-1]
+
+
+def deduplicate_documents(documents):
+    """
+    Removes duplicate comments (same comment id) from a list of documents, e.g. after
+    scraping overlapping date ranges. If a comment was scraped more than once, the version
+    that appears last is kept because it carries the latest score.
+    Comments without a permalink cannot be matched and are all kept.
+
+    :param documents: list[dict]
+    :return: list[dict]
+
+    >>> docs = [
+    ...     {'url': 'https://www.reddit.com/r/a/comments/1/t/c1/', 'score': 3},
+    ...     {'url': 'https://www.reddit.com/r/a/comments/1/t/c2/', 'score': 5},
+    ...     {'url': 'https://www.reddit.com/r/a/comments/1/t/c1/', 'score': 10},
+    ... ]
+    >>> [(get_comment_id(doc), doc['score']) for doc in deduplicate_documents(docs)]
+    [('c1', 10), ('c2', 5)]
+    """
+
+    # a dict remembers the position where a key was first inserted, so the output keeps the
+    # original order while later copies of a comment overwrite the earlier ones.
+    documents_by_id = {}
+    for idx, document in enumerate(documents):
+        comment_id = get_comment_id(document)
+        if comment_id is None:
+            comment_id = ('no_id', idx)
+        documents_by_id[comment_id] = document
+    return list(documents_by_id.values())
+
+
+def merge_csv_files(input_paths, output_path, rows_per_chunk=100000, max_open_files=64):
+    """
+    Merges multiple scraped csv files (e.g. the daily files in data/corona) into one csv file
+    sorted by date, with duplicate comments removed.
+
+    This works like an external sort, so neither the input files nor a list of all comment
+    ids are ever held in memory:
+    1) The input is cut into chunks of rows_per_chunk rows. Each chunk is sorted by comment
+       id and written to a temporary file (a "run").
+    2) The runs are merged, which puts all copies of a comment next to each other. Of these,
+       only the copy from the file that comes later in input_paths is kept (it has the latest
+       score). The remaining comments are again cut into chunks, sorted by date and written
+       to new runs.
+    3) These runs are merged into the output file.
+
+    Because duplicates are found by id, it doesn't matter that copies of a comment can have
+    different dates (the date depends on the timezone of the machine that scraped it).
+    Comments without a permalink can't be matched and are all kept.
+    At most max_open_files runs are merged at once. If there are more, they are first merged
+    into bigger runs in several passes.
+
+    :param input_paths: list of str or Path, in the order they were scraped
+    :param output_path: str or Path
+    :param rows_per_chunk: int, max number of rows held in memory while sorting
+    :param max_open_files: int, max number of runs that are read at the same time
+    :return: int, number of comments written
+    """
+
+    if not isinstance(rows_per_chunk, int) or rows_per_chunk < 1:
+        raise ValueError("rows_per_chunk has to be a positive integer.")
+    if not isinstance(max_open_files, int) or max_open_files < 2:
+        raise ValueError("max_open_files has to be an integer of at least 2.")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+
+        # 1) sorted runs by comment id. position counts rows across all input files, so
+        # a higher position means the comment was scraped later.
+        id_runs = _write_sorted_runs(_read_input_files(input_paths), temp_dir,
+                                     rows_per_chunk, key=_get_id_key)
+
+        # 2) drop older copies of each comment and re-sort the rest by date
+        rows_by_id = _merge_runs(id_runs, temp_dir, max_open_files, key=_get_id_key)
+        date_runs = _write_sorted_runs(_keep_latest_copies(rows_by_id), temp_dir,
+                                       rows_per_chunk, key=_get_date_key)
+
+        # 3) write all comments sorted by date
+        number_of_comments = 0
+        with open(output_path, 'w', encoding='utf-8', newline='') as outfile:
+            writer = csv.DictWriter(outfile, fieldnames=FIELDNAMES)
+            writer.writeheader()
+            for row in _merge_runs(date_runs, temp_dir, max_open_files, key=_get_date_key):
+                del row['position']
+                writer.writerow(row)
+                number_of_comments += 1
+
+    return number_of_comments
+
+
+def _read_input_files(input_paths):
+    """
+    Yields the rows of all input files, one after the other, with their position added.
+
+    :param input_paths: list of str or Path
+    :return: generator of dicts
+    """
+    position = 0
+    for input_path in input_paths:
+        with open(input_path, encoding='utf-8', newline='') as infile:
+            for row in csv.DictReader(infile):
+                row['position'] = position
+                position += 1
+                yield row
+
+
+def _keep_latest_copies(rows):
+    """
+    Takes rows sorted by _get_id_key and only yields the last (i.e. latest) copy of each
+    comment. Rows without comment id are all yielded.
+
+    :param rows: iterable of dicts
+    :return: generator of dicts
+    """
+    previous_row = None
+    for row in rows:
+        if previous_row is not None:
+            comment_id = get_comment_id(row)
+            if comment_id is None or comment_id != get_comment_id(previous_row):
+                yield previous_row
+        previous_row = row
+    if previous_row is not None:
+        yield previous_row
+
+
+def _write_sorted_runs(rows, temp_dir, rows_per_chunk, key):
+    """
+    Cuts rows into chunks of rows_per_chunk rows, sorts each chunk by key and writes it to a
+    temporary csv file. Chunks continue across input files, so every run except the last one
+    has exactly rows_per_chunk rows.
+
+    :param rows: iterable of dicts
+    :param temp_dir: str
+    :param rows_per_chunk: int
+    :param key: function to sort by
+    :return: list of Paths
+    """
+    run_paths = []
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == rows_per_chunk:
+            chunk.sort(key=key)
+            run_paths.append(_write_run(chunk, temp_dir))
+            chunk = []
+    if chunk:
+        chunk.sort(key=key)
+        run_paths.append(_write_run(chunk, temp_dir))
+    return run_paths
+
+
+def _merge_runs(run_paths, temp_dir, max_open_files, key):
+    """
+    Merges sorted runs into one sorted stream of rows without ever opening more than
+    max_open_files runs at once. If there are too many runs, groups of max_open_files runs
+    are first merged into new, bigger runs until few enough are left.
+
+    :param run_paths: list of Paths
+    :param temp_dir: str
+    :param max_open_files: int
+    :param key: function the runs are sorted by
+    :return: generator of dicts
+    """
+    while len(run_paths) > max_open_files:
+        merged_run_paths = []
+        for idx in range(0, len(run_paths), max_open_files):
+            group = run_paths[idx: idx + max_open_files]
+            merged_run_paths.append(
+                _write_run(heapq.merge(*[_read_run(path) for path in group], key=key),
+                           temp_dir))
+            for path in group:
+                path.unlink()
+        run_paths = merged_run_paths
+
+    return heapq.merge(*[_read_run(path) for path in run_paths], key=key)
+
+
+def _write_run(rows, temp_dir):
+    """
+    Writes rows (with their position) to a new temporary csv file.
+
+    :param rows: iterable of dicts
+    :param temp_dir: str
+    :return: Path
+    """
+    with tempfile.NamedTemporaryFile('w', dir=temp_dir, suffix='.csv', delete=False,
+                                     encoding='utf-8', newline='') as outfile:
+        writer = csv.DictWriter(outfile, fieldnames=FIELDNAMES + ['position'])
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+    return Path(outfile.name)
+
+
+def _read_run(run_path):
+    """
+    Yields the rows of a temporary csv file written by _write_run.
+
+    :param run_path: Path
+    :return: generator of dicts
+    """
+    with open(run_path, encoding='utf-8', newline='') as infile:
+        for row in csv.DictReader(infile):
+            row['position'] = int(row['position'])
+            yield row
+
+
+def _get_id_key(row):
+    """
+    Sort key that puts all copies of a comment next to each other, oldest copy first.
+    Rows without comment id sort first, by position.
+
+    :param row: dict
+    :return: tuple
+    """
+    comment_id = get_comment_id(row)
+    return comment_id is not None, comment_id or '', row['position']
+
+
+def _get_date_key(row):
+    """
+    Sort key for the output: by date, and comments of the same day in the order they were
+    scraped.
+
+    :param row: dict
+    :return: tuple
+    """
+    return row['date'], row['position']
+
+
+if __name__ == '__main__':
+    corona_paths = sorted(Path('data', 'corona').glob('*.csv'))
+    count = merge_csv_files(corona_paths, Path('data', 'coronavirus_merged.csv'))
+    print(f'Merged {len(corona_paths)} files into {count} comments.')
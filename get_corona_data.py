@@ -2,10 +2,10 @@
 # to do that, we need to import the reddit scraper from reddit_scraper.py, which the following
 # line does.
 from reddit_scraper import RedditScraper
+from deduplicate import deduplicate_documents
 
 from datetime import date, timedelta
 
-from IPython import embed
 from pathlib import Path
 
 import csv
@@ -46,6 +46,9 @@ def get_daily_corona_data(search_term, subreddit, filename):
         current_date += timedelta(days=1)
         time.sleep(1)
 
+    # comments that were scraped more than once only get stored once (with the latest score)
+    documents = deduplicate_documents(documents)
+
     filepath = Path(f'data/{filename}')
     with open(filepath, 'w') as csvfile:
         fieldnames = ['date', 'author', 'subreddit', 'score', 'url', 'text']
@@ -1,17 +1,30 @@
 from datetime import date, timedelta
+from functools import lru_cache
 import re
-import matplotlib.pyplot as plt
 import csv
 
 from corona_dataset import CoronaDataset
 
 
+@lru_cache(maxsize=None)
+def get_dataset():
+    """
+    Load the coronavirus dataset the first time it is needed and re-use it afterwards.
+    Loading the dataset takes a while, so we don't want to do it when this module gets
+    imported or once for every search term.
+    """
+    return CoronaDataset()
+
+
 def create_ngram_plot(term, display_mode='counts'):
     """
     Create and show an ngram plot for the provided term within the
     reddit coronavirus dataset
     """
 
+    # matplotlib is slow to import, so we only import it when we actually create a plot
+    import matplotlib.pyplot as plt
+
     if display_mode == 'counts':
         search_term_counts_by_day = get_daily_counts_of_search_term(term)
     else:
@@ -96,7 +109,7 @@ def get_daily_counts_of_search_term(term):
     in the dataset as a list
     """
 
-    dataset = CoronaDataset()
+    dataset = get_dataset()
     all_dates = get_all_days_between_start_date_and_end_date()
 
     search_term_counts_by_day = []
@@ -142,7 +155,7 @@ def get_daily_frequencies_of_search_term(term):
     in the dataset as a list
     """
 
-    dataset = CoronaDataset()
+    dataset = get_dataset()
     all_dates = get_all_days_between_start_date_and_end_date()
 
     search_term_frequencies_by_day = []
@@ -0,0 +1,127 @@
+import csv
+
+import pytest
+
+import cli
+import corona_dataset
+import ngram_plot
+import reddit_scraper
+
+
+class FakeRedditScraper:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.output_filename = 'not called'
+        FakeRedditScraper.instances.append(self)
+
+    def execute_query_and_store_as_csv(self, output_filename=None):
+        self.output_filename = output_filename
+
+
+class FakeCoronaDataset:
+    instances = []
+
+    def __init__(self, dataset_name='all_subreddits'):
+        self.dataset_name = dataset_name
+        self.sample_kwargs = None
+        FakeCoronaDataset.instances.append(self)
+
+    def get_data_sample(self, **kwargs):
+        self.sample_kwargs = kwargs
+        return [{'date': '2020-01-01', 'author': 'author', 'subreddit': 'Coronavirus',
+                 'score': 5, 'url': 'https://www.reddit.com/r/Coronavirus/comments/a/t/c1/',
+                 'text': 'some text'}]
+
+
+@pytest.fixture(autouse=True)
+def fakes(monkeypatch):
+    FakeRedditScraper.instances = []
+    FakeCoronaDataset.instances = []
+    monkeypatch.setattr(reddit_scraper, 'RedditScraper', FakeRedditScraper)
+    monkeypatch.setattr(corona_dataset, 'CoronaDataset', FakeCoronaDataset)
+
+
+def test_scrape():
+    cli.main(['scrape', '--search-term', 'coronavirus', '--subreddit', 'china_flu',
+              '--number-of-results', '2000', '--start-date', '2020-01-01',
+              '--end-date', '2020-01-02', '--min-score', '2', '--output-filename', 'corona'])
+
+    scraper, = FakeRedditScraper.instances
+    assert scraper.kwargs == {
+        'search_term': 'coronavirus', 'subreddit': 'china_flu', 'number_of_results': 2000,
+        'start_date': '2020-01-01', 'end_date': '2020-01-02', 'min_score': 2,
+        'sort_by': 'score'
+    }
+    assert scraper.output_filename == 'corona'
+
+
+def test_scrape_defaults():
+    cli.main(['scrape'])
+
+    scraper, = FakeRedditScraper.instances
+    assert scraper.kwargs == {
+        'search_term': None, 'subreddit': None, 'number_of_results': 100,
+        'start_date': '1990-01-01', 'end_date': '2030-01-01', 'min_score': 0,
+        'sort_by': 'score'
+    }
+    assert scraper.output_filename is None
+
+
+def test_sample(tmp_path):
+    output_path = tmp_path / 'sample.csv'
+    cli.main(['sample', '--dataset', 'coronavirus', '--start-date', '2020-02-01',
+              '--end-date', '2020-02-10', '--number-of-comments', '50',
+              '--minimum-number-of-words-per-comment', '3', '--select-by', 'score',
+              '--must-include-terms', 'washington', 'seattle',
+              '--must-exclude-terms', 'trump', '--output', str(output_path)])
+
+    dataset, = FakeCoronaDataset.instances
+    assert dataset.dataset_name == 'coronavirus'
+    assert dataset.sample_kwargs == {
+        'start_date': '2020-02-01', 'end_date': '2020-02-10', 'number_of_comments': 50,
+        'minimum_number_of_words_per_comment': 3, 'select_by': 'score',
+        'must_include_terms': ['washington', 'seattle'], 'must_exclude_terms': ['trump']
+    }
+
+    with open(output_path, encoding='utf-8') as infile:
+        rows = list(csv.DictReader(infile))
+    assert [row['text'] for row in rows] == ['some text']
+
+
+def test_sample_defaults(tmp_path):
+    cli.main(['sample', '--output', str(tmp_path / 'sample.csv')])
+
+    dataset, = FakeCoronaDataset.instances
+    assert dataset.dataset_name == 'all_subreddits'
+    assert dataset.sample_kwargs == {
+        'start_date': '2020-01-01', 'end_date': '2020-04-04', 'number_of_comments': 1000,
+        'minimum_number_of_words_per_comment': 10, 'select_by': 'random',
+        'must_include_terms': None, 'must_exclude_terms': None
+    }
+
+
+def test_ngrams(monkeypatch):
+    calls = []
+    monkeypatch.setattr(ngram_plot, 'store_ngram_data_in_csv',
+                        lambda terms, filename: calls.append((terms, filename)))
+
+    cli.main(['ngrams', 'covid', 'wuhan virus', '--output', 'corona_names.csv'])
+
+    assert calls == [(['covid', 'wuhan virus'], 'corona_names.csv')]
+
+
+@pytest.mark.parametrize('argv', [
+    ['sample', '--output', 'sample.txt'],
+    ['ngrams', 'covid', '--output', 'corona_names.txt'],
+    ['scrape', '--number-of-results', 'many'],
+    ['sample', '--select-by', 'length', '--output', 'sample.csv'],
+])
+def test_invalid_arguments(argv, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(argv)
+    assert excinfo.value.code == 2
+    assert 'usage:' in capsys.readouterr().err
+    assert FakeRedditScraper.instances == []
+    assert FakeCoronaDataset.instances == []
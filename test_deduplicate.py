@@ -0,0 +1,133 @@
+import csv
+
+import pytest
+
+from deduplicate import FIELDNAMES, deduplicate_documents, get_comment_id, merge_csv_files
+
+
+def write_shard(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as outfile:
+        writer = csv.DictWriter(outfile, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def read_csv(path):
+    with open(path, encoding='utf-8', newline='') as infile:
+        return list(csv.DictReader(infile))
+
+
+def make_row(date, comment_id, score, author='author'):
+    if comment_id is None:
+        url = 'n/a'
+    else:
+        url = f'https://www.reddit.com/r/Coronavirus/comments/abc/title/{comment_id}/'
+    return {'date': date, 'author': author, 'subreddit': 'Coronavirus', 'score': score,
+            'url': url, 'text': f'text of {comment_id}'}
+
+
+def test_get_comment_id():
+    assert get_comment_id(make_row('2020-01-01', 'fmclle7', 1)) == 'fmclle7'
+    assert get_comment_id(make_row('2020-01-01', None, 1)) is None
+    assert get_comment_id({'url': ''}) is None
+
+
+def test_deduplicate_documents():
+    documents = [
+        make_row('2020-01-01', 'c1', 5),
+        make_row('2020-01-02', None, 1, author='first_na'),
+        make_row('2020-01-01', 'c2', 3),
+        make_row('2020-01-02', None, 1, author='second_na'),
+        make_row('2020-01-01', 'c1', 20),
+    ]
+    deduplicated = deduplicate_documents(documents)
+
+    # order of first appearance is kept, with the score of the last copy
+    assert [(get_comment_id(doc), doc['score']) for doc in deduplicated] == [
+        ('c1', 20), (None, 1), ('c2', 3), (None, 1)
+    ]
+    assert [doc['author'] for doc in deduplicated if get_comment_id(doc) is None] == [
+        'first_na', 'second_na'
+    ]
+
+
+def test_deduplicate_documents_without_documents():
+    assert deduplicate_documents([]) == []
+
+
+@pytest.fixture
+def shards(tmp_path):
+    # shards are sorted by score, like the files written by RedditScraper, so dates are
+    # not in order. c1 was scraped again in the second shard with a higher score.
+    first_shard = tmp_path / 'first.csv'
+    write_shard(first_shard, [
+        make_row('2020-01-03', 'c3', 8),
+        make_row('2020-01-01', 'c1', 5),
+        make_row('2020-01-02', None, 1, author='first_na'),
+    ])
+    second_shard = tmp_path / 'second.csv'
+    write_shard(second_shard, [
+        make_row('2020-01-01', 'c1', 20),
+        make_row('2020-01-04', 'c4', 7),
+        make_row('2020-01-02', None, 1, author='second_na'),
+    ])
+    return [first_shard, second_shard]
+
+
+@pytest.mark.parametrize('rows_per_chunk', [1, 2, 100000])
+def test_merge_csv_files(shards, tmp_path, rows_per_chunk):
+    output_path = tmp_path / 'merged.csv'
+    number_of_comments = merge_csv_files(shards, output_path, rows_per_chunk=rows_per_chunk)
+
+    rows = read_csv(output_path)
+    assert number_of_comments == len(rows) == 5
+
+    # output is sorted by date
+    dates = [row['date'] for row in rows]
+    assert dates == sorted(dates)
+
+    # the shared comment is only kept once, with the score from the later shard
+    c1_rows = [row for row in rows if row['url'].endswith('/c1/')]
+    assert [row['score'] for row in c1_rows] == ['20']
+
+    # comments without permalink can't be matched, so both are kept
+    assert [row['author'] for row in rows if row['url'] == 'n/a'] == ['first_na', 'second_na']
+
+
+def test_merge_csv_files_ignores_date_for_duplicates(tmp_path):
+    # the same comment scraped in two timezones can end up with different dates
+    first_shard = tmp_path / 'first.csv'
+    write_shard(first_shard, [make_row('2020-01-01', 'c1', 5)])
+    second_shard = tmp_path / 'second.csv'
+    write_shard(second_shard, [make_row('2020-01-02', 'c1', 20)])
+
+    output_path = tmp_path / 'merged.csv'
+    assert merge_csv_files([first_shard, second_shard], output_path) == 1
+    assert read_csv(output_path)[0]['score'] == '20'
+
+
+def test_merge_csv_files_with_more_shards_than_open_files(tmp_path):
+    # 10 shards with one row each; every comment id appears in two shards, the second
+    # time with a higher score
+    shard_paths = []
+    for idx in range(10):
+        shard_path = tmp_path / f'shard_{idx}.csv'
+        write_shard(shard_path, [make_row(f'2020-01-{10 - idx % 5:02d}', f'c{idx % 5}', idx)])
+        shard_paths.append(shard_path)
+
+    output_path = tmp_path / 'merged.csv'
+    number_of_comments = merge_csv_files(shard_paths, output_path, rows_per_chunk=1,
+                                         max_open_files=3)
+    assert number_of_comments == 5
+
+    rows = read_csv(output_path)
+    assert [row['date'] for row in rows] == sorted(row['date'] for row in rows)
+    assert sorted(int(row['score']) for row in rows) == [5, 6, 7, 8, 9]
+
+
+def test_merge_csv_files_without_input(tmp_path):
+    output_path = tmp_path / 'merged.csv'
+    assert merge_csv_files([], output_path) == 0
+    with open(output_path, encoding='utf-8') as infile:
+        assert infile.read().strip() == ','.join(FIELDNAMES)
@@ -0,0 +1,62 @@
+"""
+Startup-time budget: importing the ngram module and running the command line interface must
+not pull in plotting, the interactive shell or the download code. Each check runs in a fresh
+interpreter so that modules imported by other tests don't count.
+"""
+
+from pathlib import Path
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+REPO_DIR = Path(__file__).parent
+
+HEAVY_MODULES = ['matplotlib', 'IPython', 'urllib.request']
+
+# seconds, measured inside the subprocess, so interpreter startup is not included
+STARTUP_BUDGET = 0.25
+
+MEASURE_CODE = '''
+import json, runpy, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy_modules!r} if m in sys.modules]
+sys.stdout = sys.__stdout__
+print(json.dumps({{'elapsed': elapsed, 'heavy_modules': heavy}}))
+'''
+
+RUN_CLI_HELP = '''
+import io
+sys.argv = ['cli.py', '--help']
+sys.stdout = io.StringIO()
+try:
+    runpy.run_path('cli.py', run_name='__main__')
+except SystemExit:
+    pass
+'''
+
+
+def measure_startup(code):
+    result = subprocess.run(
+        [sys.executable, '-c', MEASURE_CODE.format(code=code, heavy_modules=HEAVY_MODULES)],
+        cwd=REPO_DIR, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize('code', ['import ngram_plot', RUN_CLI_HELP],
+                         ids=['import ngram_plot', 'cli.py --help'])
+def test_startup_is_light(code):
+    measurement = measure_startup(code)
+    assert measurement['heavy_modules'] == []
+    assert measurement['elapsed'] < STARTUP_BUDGET
+
+
+def test_cli_help_runs():
+    result = subprocess.run([sys.executable, 'cli.py', '--help'], cwd=REPO_DIR,
+                            capture_output=True, text=True, check=True)
+    assert 'scrape' in result.stdout